@@ -7,6 +7,9 @@ class HBoxLayout(QtWidgets.QLayout):
         self.setParent(parent)
 
         self.items = []
+        self._cachedSizeHint = None
+        self._cachedMinSize = None
+        self._resolvedSpacing = None
 
         self.setSpacing(spacing)
         self.setContentsMargins(margin, margin, margin, margin)
@@ -18,9 +21,11 @@ class HBoxLayout(QtWidgets.QLayout):
 
     def addItem(self, item):
         self.items.append(item)
+        self.invalidate()
 
     def insertItem(self, index, item):
         self.items.insert(index, item)
+        self.invalidate()
 
     def insertWidget(self, index, widget):
         self.addChildWidget(widget)
@@ -34,7 +39,17 @@ class HBoxLayout(QtWidgets.QLayout):
         return self.items[index] if 0 <= index < len(self.items) else None
 
     def takeAt(self, index):
-        return self.items.pop(index) if 0 <= index < len(self.items) else None
+        if not 0 <= index < len(self.items):
+            return None
+        item = self.items.pop(index)
+        self.invalidate()
+        return item
+
+    def invalidate(self):
+        self._cachedSizeHint = None
+        self._cachedMinSize = None
+        self._resolvedSpacing = None
+        super(HBoxLayout, self).invalidate()
 
     def expandingDirections(self):
         return QtCore.Qt.Orientation.Horizontal
@@ -50,57 +65,68 @@ class HBoxLayout(QtWidgets.QLayout):
         self.doLayout(rect, testOnly=False)
 
     def sizeHint(self):
-        l, t, r, b = self.getContentsMargins()
-        w = 0
-        h = 0
-        s = self._spacing
-        for item in self.items:
-            size = item.sizeHint()
-            if h < size.height():
-                h = size.height()
-            w += size.width()
-            if w:
-                w += s
-        w += l + r
-        h += t + b
-        return QtCore.QSize(w, h)
+        if self._cachedSizeHint is None:
+            self._measure()
+        return self._cachedSizeHint
 
     def minimumSize(self):
+        if self._cachedMinSize is None:
+            self._measure()
+        return self._cachedMinSize
+
+    def _measure(self):
+        """Compute sizeHint and minimumSize in a single pass over the items."""
         l, t, r, b = self.getContentsMargins()
-        w = 0
-        h = 0
-        s = self._spacing
+        hintW = hintH = minW = minH = 0
+        s = self.spacing()
         for item in self.items:
-            size = item.minimumSize()
-            if h < size.height():
-                h = size.height()
-            w += size.width()
-            if w:
-                w += s
-        w += l + r
-        h += t + b
-        return QtCore.QSize(w, h)
+            hint = item.sizeHint()
+            minimum = item.minimumSize()
+            h = hint.height()
+            if hintH < h:
+                hintH = h
+            h = minimum.height()
+            if minH < h:
+                minH = h
+            hintW += hint.width()
+            if hintW:
+                hintW += s
+            minW += minimum.width()
+            if minW:
+                minW += s
+        self._cachedSizeHint = QtCore.QSize(hintW + l + r, hintH + t + b)
+        self._cachedMinSize = QtCore.QSize(minW + l + r, minH + t + b)
+        return self._cachedSizeHint, self._cachedMinSize
 
     def doLayout(self, rect, testOnly):
         l, t, r, b = self.getContentsMargins()
         x = rect.x() + l
         y = rect.y() + t
-        s = self._spacing
+        s = self.spacing()
+        itemHeight = rect.height() - t - b
+        QRect = QtCore.QRect
         for item in self.items:
-            size = item.sizeHint()
-            item.setGeometry(QtCore.QRect(x, y, size.width(), rect.height() - t - b))
-            x += size.width()
+            w = item.sizeHint().width()
+            item.setGeometry(QRect(x, y, w, itemHeight))
+            x += w
             if x:
                 x += s
         return y
 
     def setSpacing(self, spacing):
         self._spacing = spacing
+        self.invalidate()
+
+    def setContentsMargins(self, *margins):
+        super(HBoxLayout, self).setContentsMargins(*margins)
+        self.invalidate()
 
     def spacing(self):
         if self._spacing >= 0:
             return self._spacing
-        return self.smartSpacing(QtWidgets.QStyle.PixelMetric.PM_LayoutHorizontalSpacing)
+        if self._resolvedSpacing is None:
+            self._resolvedSpacing = self.smartSpacing(QtWidgets.QStyle.PixelMetric.PM_LayoutHorizontalSpacing)
+        return self._resolvedSpacing
 
     def smartSpacing(self, pm):
         parent = self.parent()
@@ -1,11 +1,48 @@
 import functools
+import re
 from numbers import Real
-from typing import Tuple
+from typing import Tuple, Union
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 VALID_COLORS = "0123456789abcdef"
 
+# Qt parses 8 digit hex strings as #AARRGGBB and rejects #RGBA, so the forms with an alpha channel are decoded here.
+_HEX_ALPHA_RE = re.compile(r'#(?:[0-9a-f]{4}|[0-9a-f]{8})')
+# QColor(str) on its own would also take #RRRGGGBBB, #RRRRGGGGBBBB and names with spaces, only pass it these.
+_HEX_RGB_RE = re.compile(r'#(?:[0-9a-f]{3}|[0-9a-f]{6})')
+_COLOR_NAMES = frozenset(QtGui.QColor.colorNames())
+
+_HEX_NIBBLE = {c: int(c + c, 16) for c in VALID_COLORS}
+_HEX_BYTE = {f'{v:02x}': v for v in range(256)}
+
+
+def _parseRgba(color: str) -> Tuple[int, ...]:
+    return _HEX_NIBBLE[color[1]], _HEX_NIBBLE[color[2]], _HEX_NIBBLE[color[3]], _HEX_NIBBLE[color[4]]
+
+
+def _parseRrggbbaa(color: str) -> Tuple[int, ...]:
+    return _HEX_BYTE[color[1:3]], _HEX_BYTE[color[3:5]], _HEX_BYTE[color[5:7]], _HEX_BYTE[color[7:9]]
+
+
+# keyed on the length of the color string, including the leading '#'
+_HEX_ALPHA_PARSERS = {5: _parseRgba, 9: _parseRrggbbaa}
+
+
+def _parseColorString(color: str) -> QtGui.QColor:
+    color = color.strip().lower()
+
+    if _HEX_ALPHA_RE.fullmatch(color):
+        return QtGui.QColor(*_HEX_ALPHA_PARSERS[len(color)](color))
+
+    if color in _COLOR_NAMES or _HEX_RGB_RE.fullmatch(color):
+        return QtGui.QColor(color)
+    raise ValueError(f"Invalid color string: {color} ")
+
+
+_FLOAT_TOOLTIP = "R: {:.3f} green: {:.3f}  B: {:.3f}  A: {:.3f}".format
+_INT_TOOLTIP = "R: {} green: {}  B: {}  A: {}".format
+
 
 class ColorBox(QtWidgets.QWidget):
     """
@@ -25,6 +62,7 @@ class ColorBox(QtWidgets.QWidget):
         self._hsv = None
         self._hsl = None
         self._color = None
+        self._isFloat = False
         self._height = kwargs['height'] if 'height' in kwargs else 24
         self._width = kwargs['width'] if 'width' in kwargs else int(self._height * 1.7777)
         self.setAutoFillBackground(True)
@@ -62,82 +100,43 @@ class ColorBox(QtWidgets.QWidget):
     def hsv(self) -> Tuple[int, ...]:
         return self._color.getHsv()
 
-    @functools.singledispatchmethod
-    def setColor(self, red: Real, green: Real, blue: Real, alpha: Real = 1.0) -> None:
-        self._color = QtGui.QColor.fromRgbF(*self.clamp(red, green, blue, alpha))
-        self._rgb = self._color.getRgbF()
-        self.update()
-
-    @setColor.register(int)
-    def _(self, red: int, green: int, blue: int, alpha: int = 255) -> None:
-        self._color = QtGui.QColor.fromRgb(*self.clamp(red, green, blue, alpha))
-        self._rgb = self._color.getRgb()
-        self.update()
+    def setColor(self, red: Union[Real, str, QtGui.QColor], green: Real = None, blue: Real = None,
+                 alpha: Real = None) -> None:
+        """
+        Accepts a QColor, a color string, or red, green, blue and an optional alpha.
+        int channels range from 0 to 255, any other number is treated as a float from 0.0 to 1.0
+        """
+        isFloat = False
+        if isinstance(red, QtGui.QColor):
+            color = red
+        elif isinstance(red, str):
+            color = _parseColorString(red)
+        elif isinstance(red, int):
+            color = QtGui.QColor.fromRgb(*self.clamp(red, green, blue, 255 if alpha is None else alpha))
+        else:
+            color = QtGui.QColor.fromRgbF(*self.clamp(red, green, blue, 1.0 if alpha is None else alpha))
+            isFloat = True
 
-    @setColor.register(QtGui.QColor)
-    def _(self, color: QtGui.QColor) -> None:
         self._color = color
-        self._rgb = self._color.getRgb()
-        self.update()
-
-    @setColor.register(str)
-    def _(self, color: str) -> None:
-        color = color.lower().strip()
-        num_chars = len(color)
-
-        if color in QtGui.QColor.colorNames():
-            self._color = QtGui.QColor(color)
-            self._rgb = self._color.getRgb()
-            self.update()
-            return
-        if color[0] != "#" or any(char not in VALID_COLORS for char in color[1:]) or num_chars not in {4, 5, 7, 9}:
-            raise ValueError(f"Invalid color string: {color} ")
-
-        if len(color) in {7, 4}:
-            self._color = QtGui.QColor(color)
-            self._rgb = self._color.getRgb()
-            self.update()
-            return
-
-        elif num_chars in {9, 5}:
-            color = color[1:]
-            if num_chars == 5:
-                color = (int(color[0] * 2, 16),
-                         int(color[1] * 2, 16),
-                         int(color[2] * 2, 16),
-                         int(color[3] * 2, 16))
-            else:
-                color = (int(color[:2], 16),
-                         int(color[2:4], 16),
-                         int(color[4:6], 16),
-                         int(color[6:], 16))
-
-        self._color = QtGui.QColor(*color)
-        self._rgb = self._color.getRgb()
+        self._rgb = color.getRgbF() if isFloat else color.getRgb()
+        self._isFloat = isFloat
         self.update()
 
     def update(self) -> None:
         super().update()
-        if any(isinstance(chan, float) in self._rgb for chan in self._rgb):
+        if self._isFloat:
             self.red, self.green, self.blue, self.alpha = self._color.getRgbF()
-            tooltip = f"R: {self.red:.3f} green: {self.green:.3f}  B: {self.blue:.3f}  A: {self.alpha:.3f}"
+            tooltip = _FLOAT_TOOLTIP(self.red, self.green, self.blue, self.alpha)
         else:
             self.red, self.green, self.blue, self.alpha = self._color.getRgb()
-            tooltip = f"R: {self.red} green: {self.green}  B: {self.blue}  A: {self.alpha}"
+            tooltip = _INT_TOOLTIP(self.red, self.green, self.blue, self.alpha)
         self.setToolTip(f"Hex: {self._color.name()}\n{tooltip}")
 
-    @functools.singledispatchmethod
-    def clamp(self, red, green, blue, alpha) -> Tuple[int, ...]:
-        red = max(0, min(255, red))
-        green = max(0, min(255, green))
-        blue = max(0, min(255, blue))
-        alpha = max(0, min(255, alpha))
-        return red, green, blue, alpha
-
-    @clamp.register(float)
-    def _(self, red: float, green: float, blue: float, alpha: float) -> Tuple[float, ...]:
-        red = max(0, min((1, red)))
-        green = max(0, min((1, green)))
-        blue = max(0, min((1, blue)))
-        alpha = max(0, min((1, alpha)))
+    def clamp(self, red: Real, green: Real, blue: Real, alpha: Real) -> Tuple[Real, ...]:
+        """Clamp each channel to 1 when red is a float, otherwise to 255."""
+        top = 1 if isinstance(red, float) else 255
+        red = max(0, min(top, red))
+        green = max(0, min(top, green))
+        blue = max(0, min(top, blue))
+        alpha = max(0, min(top, alpha))
         return red, green, blue, alpha
@@ -1,5 +1,5 @@
-import decimal
 import functools
+import math
 import random
 import sys
 
@@ -12,7 +12,55 @@ from PyQt6.QtGui import QAction, QActionGroup
 
 MIME_TYPE_COLOR = 'application/x-color'
 
-decimal.setcontext(decimal.Context(prec=4, rounding=decimal.ROUND_HALF_UP))
+# QMouseEvent.pos() is deprecated in Qt 6 in favor of position()
+_HAS_POSITION = hasattr(QtGui.QMouseEvent, 'position')
+
+_COPY_KEY_COMBINATION = QKeyCombination(Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_C)
+
+
+def _roundHalfUp(value: float) -> int:
+    return math.floor(value + 0.5)
+
+
+def _formatHex(color: QtGui.QColor) -> str:
+    return color.name().upper()
+
+
+def _formatRgb(color: QtGui.QColor) -> str:
+    red, green, blue, _ = color.getRgbF()  # ignore alpha
+    return f'rgb({_roundHalfUp(red * 255)}, {_roundHalfUp(green * 255)}, {_roundHalfUp(blue * 255)}) '
+
+
+def _formatHsl(color: QtGui.QColor) -> str:
+    _, saturation, lightness, _ = color.getHslF()  # ignore hue and alpha
+    h = _roundHalfUp(color.hslHueF() * 360)
+    return f'hsl({h}\u00B0, {_roundHalfUp(saturation * 100)}%, {_roundHalfUp(lightness * 100)}%) '
+
+
+def _formatHsv(color: QtGui.QColor) -> str:
+    _, saturation, value, _ = color.getHsvF()  # ignore hue and alpha
+    h = _roundHalfUp(color.hsvHueF() * 360)
+    return f'hsv({h}\u00B0, {_roundHalfUp(saturation * 100)}%, {_roundHalfUp(value * 100)}%) '
+
+
+def _formatCmyk(color: QtGui.QColor) -> str:
+    cmyk = color.getCmykF()[:-1]  # ignore alpha
+    cyan, magenta, yellow, black = [_roundHalfUp(c * 100) for c in cmyk]
+    return f'cmyk({cyan}%, {magenta}%, {yellow}%, {black}%) '
+
+
+def _formatNone(color: QtGui.QColor) -> str:
+    return ''
+
+
+# keyed on the lowercase color format name
+_COLOR_FORMATTERS = {
+    'hex': _formatHex,
+    'rgb': _formatRgb,
+    'hsl': _formatHsl,
+    'hsv': _formatHsv,
+    'cmyk': _formatCmyk,
+}
 
 
 class ColorButton(QtWidgets.QPushButton):
@@ -38,6 +86,16 @@ class ColorButton(QtWidgets.QPushButton):
     colorChanged = QtCore.pyqtSignal(object)
     colorFormat = 'RGB'
 
+    # lazy attempt to make a checkerboard pattern
+    _errorBrush = QtGui.QBrush(QtGui.QColorConstants.Svg.black, QtCore.Qt.BrushStyle.Dense4Pattern)
+    # define the error color here incase the outline color is changed.
+    _errorPen = QtGui.QPen(QtGui.QColorConstants.Svg.red)
+    _errorHoverBrush = QtGui.QBrush(QtGui.QColor(255, 0, 0, 40))
+
+    # shared by every instance and subclass, recomputed when the application palette changes. see usesLightTheme()
+    _lightTheme = None
+    _lightThemePaletteKey = None
+
     def __init__(self, text=None, parent=None, color=None, sizeHint=None, outlineColor=None):
         super().__init__(text, parent)
 
@@ -46,22 +104,50 @@ class ColorButton(QtWidgets.QPushButton):
         self.setMouseTracking(True)
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
 
-        self.contextMenu = QtWidgets.QMenu(self)
         self.customContextMenuRequested.connect(self.onContextMenu)
-        self.addActionsToContextMenu()
         self.__colorString = ''
+        self.__colorFormat = None
+        self.__colorFormatter = _formatNone
         self.__color = color or QtGui.QColor('Invalid')
-        self.__dragStartPosition = QtCore.QPoint()
+        self.__dragStartX = self.__dragStartY = 0
+        self.__startDragDistance = QtWidgets.QApplication.startDragDistance()
         self.__hoverOutlineColor = QtGui.QColor(200, 30, 0)
         self.__clickToOpen = False
+        self.__pendingColor = None
+        self.__hover = False
+        self.__contextMenuVisible = False
+        # built on first use, see contextMenu
+        self.__contextMenu = None
         self.__outlineColor = outlineColor or QtGui.QColorConstants.Svg.black
         self.__sizeHintSize = sizeHint or QtCore.QSize(24, 24)
+        self.__contentsRect = None
+        self.__outlinePen = None
+        self.__hoverOutlinePen = None
+        self.__dragPixmap = None
+        self.__dragPixmapKey = None
+        self.__mimeBytes = None
+        self.__mimeColor = None
 
-        self.setColor(self.__color)
+        self.__parseColor()
 
-        if QtWidgets.QApplication.instance().palette().base().color().lightnessF() > 0.5:
+        if self.usesLightTheme():
             self.__outlineColor = QtGui.QColorConstants.Svg.lightgrey
 
+    @staticmethod
+    def usesLightTheme() -> bool:
+        """
+        True when the application palette has a light base color.
+        The result is computed once and shared by all ColorButtons until the palette changes.
+        """
+        palette = QtWidgets.QApplication.instance().palette()
+        # the cache key changes whenever the application palette is replaced or modified,
+        # so this works without a live ColorButton to receive ApplicationPaletteChange
+        key = palette.cacheKey()
+        if ColorButton._lightThemePaletteKey != key:
+            ColorButton._lightThemePaletteKey = key
+            ColorButton._lightTheme = palette.base().color().lightnessF() > 0.5
+        return ColorButton._lightTheme
+
     def copyColorString(self) -> None:
         """
         Copy the current color string to the clipboard.
@@ -69,6 +155,18 @@ class ColorButton(QtWidgets.QPushButton):
 
         QtWidgets.QApplication.clipboard().setText(self.__colorString)
 
+    @property
+    def contextMenu(self) -> QtWidgets.QMenu:
+        """The button's context menu. Built and filled by addActionsToContextMenu() on first use."""
+        if self.__contextMenu is None:
+            self.__contextMenu = QtWidgets.QMenu(self)
+            self.addActionsToContextMenu()
+        return self.__contextMenu
+
+    @contextMenu.setter
+    def contextMenu(self, contextMenu: QtWidgets.QMenu) -> None:
+        self.__contextMenu = contextMenu
+
     def addActionsToContextMenu(self):
         copyAction = QAction('Copy', self)
         copyAction.triggered.connect(self.copyColorString)
@@ -77,10 +175,12 @@ class ColorButton(QtWidgets.QPushButton):
         colorFormatGroup = QActionGroup(self)
         colorFormatMenu = self.contextMenu.addMenu('Value Type')
 
+        # the menu is built lazily, so check whatever format is current by then
+        colorFormat = self.colorFormat.lower()
         for x in "Hex RGB HSL HSV CMYK".split():
             a = colorFormatMenu.addAction(x)
             a.setCheckable(True)
-            if x == self.colorFormat:
+            if x.lower() == colorFormat:
                 a.setChecked(True)
             colorFormatGroup.addAction(a)
 
@@ -88,11 +188,11 @@ class ColorButton(QtWidgets.QPushButton):
         colorFormatGroup.setExclusive(True)
 
     def onContextMenu(self):
-        self.setProperty('contextMenuVisible', True)
+        self.__setContextMenuVisible(True)
         center = self.mapToGlobal(self.rect().center())
         self.contextMenu.exec(center)
         self.contextMenu.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
-        self.setProperty('contextMenuVisible', False)
+        self.__setContextMenuVisible(False)
 
     def onColorFormatChanged(self, action: QAction):
         text = action.text()
@@ -119,7 +219,7 @@ class ColorButton(QtWidgets.QPushButton):
 
     def enterEvent(self, event: QtGui.QEnterEvent) -> None:
         event.accept()
-        self.setProperty('hover', True)
+        self.__setHover(True)
         # we're setting focus here so we can use the cursor to target a color to copy in the keyPressEvent
         self.setFocus(QtCore.Qt.FocusReason.MouseFocusReason)
         return super(ColorButton, self).enterEvent(event)
@@ -127,73 +227,113 @@ class ColorButton(QtWidgets.QPushButton):
     def leaveEvent(self, event: QtCore.QEvent) -> None:
         event.accept()
         # make sure we don't leave the button highlighted when the cursor leaves the button
-        self.setProperty('hover', False)
+        self.__setHover(False)
         return super(ColorButton, self).leaveEvent(event)
 
-    def paintEvent(self, event) -> None:
-        painter = QtGui.QPainter(self)
-
+    def __setHover(self, hover: bool) -> None:
+        if self.__hover == hover:
+            return
+        self.__hover = hover
+        # keep the dynamic property for style sheets using [hover="true"]
+        self.__setStyleProperty('hover', hover)
+
+    def __setContextMenuVisible(self, visible: bool) -> None:
+        self.__contextMenuVisible = visible
+        self.__setStyleProperty('contextMenuVisible', visible)
+
+    def __setStyleProperty(self, name: str, value: bool) -> None:
+        self.setProperty(name, value)
+        # style sheets only re-evaluate property selectors on polish
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self.__contentsRect = None
+        self.__dragPixmap = self.__dragPixmapKey = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.StyleChange:
+            self.__contentsRect = None
+        super().changeEvent(event)
+
+    def __updateContentsRect(self) -> None:
         option = QtWidgets.QStyleOptionButton()
         option.initFrom(self)
         option.rect = QtCore.QRect(self.rect())
         option.state = QtWidgets.QStyle.StateFlag.State_Raised
         option.features = QtWidgets.QStyleOptionButton.ButtonFeature.Flat
 
-        rect = QtCore.QRectF(
+        self.__contentsRect = QtCore.QRectF(
             self.style().subElementRect(
                 QtWidgets.QStyle.SubElement.SE_PushButtonContents, option, self
             )
         )
 
-        pen = QtGui.QPen(self.__outlineColor)
-        pen.setCosmetic(True)
+    def __updateContents(self) -> None:
+        """Schedule a repaint of the swatch only, the margin around it never changes with the color or hover."""
+        if self.__contentsRect is None:
+            self.update()
+            return
+        # grow by a pixel to cover the outline drawn on the rect's edges
+        self.update(self.__contentsRect.toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def __pen(self, hover: bool) -> QtGui.QPen:
+        if self.__outlinePen is None:
+            self.__outlinePen = QtGui.QPen(self.__outlineColor)
+            self.__outlinePen.setCosmetic(True)
+            self.__hoverOutlinePen = QtGui.QPen(self.__hoverOutlineColor)
+            self.__hoverOutlinePen.setCosmetic(True)
+        return self.__hoverOutlinePen if hover else self.__outlinePen
+
+    def paintEvent(self, event) -> None:
+        painter = QtGui.QPainter(self)
+        # only axis-aligned rects and lines are drawn
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
 
-        if self.property('hover') or self.property('contextMenuVisible'):
-            pen = QtGui.QPen(self.__hoverOutlineColor)
-        painter.setPen(pen)
+        if self.__contentsRect is None:
+            self.__updateContentsRect()
+        rect = self.__contentsRect
 
-        path = QtGui.QPainterPath()
-        path.addRect(rect)
+        painter.setPen(self.__pen(self.__hover or self.__contextMenuVisible))
 
         if self.__color.isValid():
-            painter.fillPath(path, self.__color)
-        else:
-            self.paintErrorBox(painter, path, rect)
-        painter.drawPath(path)
+            painter.fillRect(rect, self.__color)
+            painter.drawRect(rect)
+            return
+
+        self.paintErrorBox(painter, rect)
+        painter.drawRect(rect)
 
-    def paintErrorBox(self, painter, path, rect):
+    def paintErrorBox(self, painter, rect):
         """
         Draw a red outline around the button and paint a red X across the button
 
         """
 
-        b = QtGui.QBrush(QtGui.QColor(QtGui.QColorConstants.Svg.black))
-        # lazy attempt to make a checkerboard pattern
-        b.setStyle(QtCore.Qt.BrushStyle.Dense4Pattern)
-        painter.fillPath(path, b)
-        # define the error color here incase the outline color is changed.
-        painter.setPen(QtGui.QPen(QtGui.QColor(QtGui.QColorConstants.Svg.red)))
+        painter.fillRect(rect, self._errorBrush)
+        painter.setPen(self._errorPen)
 
-        if self.property('hover'):
+        if self.__hover:
             # if for some reason the red outline and the red X don't standout enough
             # fill the button rect with a translucent red when the cursor is hovering over the button
-            b = QtGui.QBrush(QtGui.QColor(QtGui.QColor(255, 0, 0, 40)))
-            painter.fillPath(path, b)
+            painter.fillRect(rect, self._errorHoverBrush)
         # paint the X
         painter.drawLine(rect.topLeft(), rect.bottomRight())
         painter.drawLine(rect.topRight(), rect.bottomLeft())
 
     def dragLeaveEvent(self, event: QtGui.QDragLeaveEvent) -> None:
-        self.setProperty('hover', False)
-        self.update()
+        self.__setHover(False)
+        self.__updateContents()
 
     def dragEnterEvent(self, event) -> None:
         if not event.mimeData().hasFormat(MIME_TYPE_COLOR):
             return
 
         event.acceptProposedAction()
-        self.setProperty('hover', True)
-        self.update()
+        self.__setHover(True)
+        self.__updateContents()
 
     def dropEvent(self, event) -> None:
         if not event.mimeData().hasFormat(MIME_TYPE_COLOR):
@@ -211,9 +351,7 @@ class ColorButton(QtWidgets.QPushButton):
         self.setColor(color)
 
     def keyPressEvent(self, event):
-        if event.keyCombination() != QKeyCombination(
-                Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_C
-        ):
+        if event.keyCombination() != _COPY_KEY_COMBINATION:
             return super().keyPressEvent(event)
         event.accept()
         self.copyColorString()
@@ -221,7 +359,11 @@ class ColorButton(QtWidgets.QPushButton):
     def mousePressEvent(self, event) -> None:
         if not event.button() & QtCore.Qt.MouseButton.LeftButton:
             return super().mousePressEvent(event)
-        self.__dragStartPosition = event.position() if hasattr('event', 'position') else event.pos()
+        pos = event.position() if _HAS_POSITION else event.pos()
+        self.__dragStartX = pos.x()
+        self.__dragStartY = pos.y()
+        # read once per press rather than on every mouse move
+        self.__startDragDistance = QtWidgets.QApplication.startDragDistance()
         self.clicked.emit()
 
     def mouseMoveEvent(self, event) -> None:
@@ -229,9 +371,8 @@ class ColorButton(QtWidgets.QPushButton):
             event.ignore()
             return super().mouseMoveEvent(event)
 
-        pos = event.position() if hasattr('event', 'position') else event.pos()
-        delta = QtCore.QPoint(pos - self.__dragStartPosition).manhattanLength()
-        if delta >= QtWidgets.QApplication.startDragDistance():
+        pos = event.position() if _HAS_POSITION else event.pos()
+        if abs(pos.x() - self.__dragStartX) + abs(pos.y() - self.__dragStartY) >= self.__startDragDistance:
             self.__dragIt()
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
@@ -246,41 +387,56 @@ class ColorButton(QtWidgets.QPushButton):
         # occasionally, the outline color isn't updated when the drag starts, so update() here to ensure it's gone.
 
         drag = QtGui.QDrag(self)
-        self.update()
-
-        data = QtCore.QByteArray()
-        stream = QtCore.QDataStream(data, QtCore.QIODevice.OpenModeFlag.WriteOnly)
-
-        image = QtGui.QImage(self.size(), QtGui.QImage.Format.Format_RGBA8888)
-        imageRect = image.rect()
-        image.fill(self.__color)
-
-        painter = QtGui.QPainter(image)
-        painter.drawImage(imageRect, image)
-        painter.setPen(self.__outlineColor)
-        painter.end()
-
-        pixmap = QtGui.QPixmap.fromImage(image)
+        self.__updateContents()
+
+        if self.__mimeColor != self.__color:
+            data = QtCore.QByteArray()
+            stream = QtCore.QDataStream(data, QtCore.QIODevice.OpenModeFlag.WriteOnly)
+            stream << self.__color
+            self.__mimeBytes = data
+            self.__mimeColor = QtGui.QColor(self.__color)
+
+        size = self.size()
+        key = (size.width(), size.height(), self.__color.rgba())
+        if self.__dragPixmapKey != key:
+            self.__dragPixmap = QtGui.QPixmap(size)
+            self.__dragPixmap.fill(self.__color)
+            self.__dragPixmapKey = key
 
-        stream << self.__color
         mimeData = QtCore.QMimeData()
-        mimeData.setData(MIME_TYPE_COLOR, data)
+        mimeData.setData(MIME_TYPE_COLOR, self.__mimeBytes)
 
         drag.setMimeData(mimeData)
-        drag.setPixmap(pixmap)
+        drag.setPixmap(self.__dragPixmap)
         drag.exec(QtCore.Qt.DropAction.CopyAction)
 
     def __openDialog(self) -> None:
         lastColor = self.__color
         colorDialog = QtWidgets.QColorDialog(self.__color)
         colorDialog.move(self.pos())
-        colorDialog.currentColorChanged.connect(self.setColor)
+        colorDialog.currentColorChanged.connect(self.__onDialogColorChanged)
         colorDialog.exec()
+        # drop any change still waiting for the event loop, the final color is applied here
+        self.__pendingColor = None
         if colorDialog.result() & QtWidgets.QColorDialog.DialogCode.Accepted:
-            colorDialog.currentColorChanged.emit(colorDialog.selectedColor())
+            self.setColor(colorDialog.selectedColor())
             return
         self.setColor(lastColor)
 
+    def __onDialogColorChanged(self, color: QtGui.QColor) -> None:
+        """
+        Coalesce the currentColorChanged signals the dialog emits while the user drags
+        so the button is updated at most once per event loop iteration.
+        """
+        if self.__pendingColor is None:
+            QtCore.QTimer.singleShot(0, self.__applyPendingColor)
+        self.__pendingColor = color
+
+    def __applyPendingColor(self) -> None:
+        color, self.__pendingColor = self.__pendingColor, None
+        if color is not None:
+            self.setColor(color)
+
     def __parseColor(self) -> None:
 
         # TODO: Is there a way to get the color profile from the system in python without using OCIO?
@@ -291,7 +447,7 @@ class ColorButton(QtWidgets.QPushButton):
 
         Occasionally, one of the values from QColor.getRgb() and QColor.getHsl() would contain
         a value that was off by one according to the Digital Color Meter utility and XScope.
-        converting values from getRgbF() and getHslF() to decimal and scaling fixes this issue.
+        scaling the values from getRgbF() and getHslF() and rounding half up fixes this issue.
 
         example:
             #F5D700
@@ -302,31 +458,11 @@ class ColorButton(QtWidgets.QPushButton):
 
         """
 
-        s = ''
-        colorFormat = self.colorFormat.lower()
-        color = self.__color
-
-        match colorFormat:
-            case 'hex':
-                s = color.name().upper()
-            case 'rgb':
-                rgb = color.getRgbF()[:-1]  # ignore alpha
-                red, green, blue = [decimal.Decimal(c) * 255 for c in rgb]
-                s = f'rgb({red:.0f}, {green:.0f}, {blue:.0f}) '
-            case 'hsl':
-                hsl = color.getHslF()[:-1]  # ignore alpha
-                h = decimal.Decimal(color.hslHueF()) * 360
-                saturation, lightness = [decimal.Decimal(c) * 100 for c in hsl[1:]]
-                s = f'hsl({h:.0f}\u00B0, {saturation:.0f}%, {lightness:.0f}%) '
-            case 'hsv':
-                hsv = color.getHsvF()[:-1]  # ignore alpha
-                h = decimal.Decimal(color.hsvHueF()) * 360
-                saturation, value = [decimal.Decimal(c) * 100 for c in hsv[1:]]
-                s = f'hsv({h:.0f}\u00B0, {saturation:.0f}%, {value:.0f}%) '
-            case 'cmyk':
-                cmyk = color.getCmykF()[:-1]  # ignore alpha
-                cyan, magenta, yellow, black = [decimal.Decimal(c) * 100 for c in cmyk]
-                s = f'cmyk({cyan:.0f}%, {magenta:.0f}%, {yellow:.0f}%, {black:.0f}%) '
+        if self.colorFormat != self.__colorFormat:
+            # colorFormat is a plain attribute and may be assigned directly, so re-key on any change
+            self.__colorFormat = self.colorFormat
+            self.__colorFormatter = _COLOR_FORMATTERS.get(self.colorFormat.lower(), _formatNone)
+        s = self.__colorFormatter(self.__color)
 
         if self.__colorString == s.replace('\u00B0', ''):
             # nothing to do
@@ -340,9 +476,13 @@ class ColorButton(QtWidgets.QPushButton):
         self.setToolTip(tooltip)
 
     def setColor(self, color) -> None:
+        if self.__color == color:
+            return
         self.__color = color
+        self.__dragPixmap = self.__dragPixmapKey = None
+        self.__mimeBytes = self.__mimeColor = None
         self.__parseColor()
-        self.update()
+        self.__updateContents()
         self.colorChanged.emit(color)
 
     @functools.cached_property
@@ -1,5 +1,30 @@
+import functools
+import time
+
 from PyQt6 import QtGui, QtWidgets
-from PyQt6.QtCore import QFile, QUrl, Qt, pyqtSignal
+from PyQt6.QtCore import QFile, QTimer, QUrl, Qt, pyqtSignal
+
+# seconds an existence check is reused for
+EXISTS_CACHE_TTL = 2.0
+
+
+@functools.lru_cache(maxsize=256)
+def _cachedExists(path, timeBucket):
+    return QFile.exists(path)
+
+
+def _exists(path):
+    """QFile.exists, memoized per path for up to EXISTS_CACHE_TTL seconds."""
+    return _cachedExists(path, int(time.monotonic() / EXISTS_CACHE_TTL))
+
+
+@functools.lru_cache(maxsize=256)
+def _localPath(text):
+    """The local path text resolves to the same way FileLineEdit.filePath() reads it, None for an invalid url."""
+    # QUrl decodes percent escapes and re-encodes characters such as '\\' or '|', so even text without a
+    # scheme can't be used as a path directly
+    url = QUrl(text)
+    return url.toString(QUrl.UrlFormattingOption.PreferLocalFile) if url.isValid() else None
 
 
 class FileLineEdit(QtWidgets.QWidget):
@@ -18,11 +43,20 @@ class FileLineEdit(QtWidgets.QWidget):
         self.lineEdit = QtWidgets.QLineEdit(self)
         self.lineEdit.setSizePolicy(QtWidgets.QSizePolicy(*sizePolicy))
         self.lineEdit.textEdited.connect(self.textEdited)
-        self.lineEdit.textChanged.connect(self.validate)
+
+        # validate once typing pauses instead of stat()ing the path on every keystroke
+        self._validateTimer = QTimer(self)
+        self._validateTimer.setSingleShot(True)
+        self._validateTimer.setInterval(100)
+        self._validateTimer.timeout.connect(self.validate)
+        self.lineEdit.textChanged.connect(self._validateTimer.start)
 
         colorGroupRole = (QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text)
         self.validTextColor = self.lineEdit.palette().color(*colorGroupRole)
         self.errorTextColor = QtGui.QColorConstants.Svg.red
+        self._isValid = None
+        self._basePalette = self.lineEdit.palette()
+        self._updatePalettes()
 
         # Focus the lineEdit when the widget gains focus
         self.setFocusProxy(self.lineEdit)
@@ -38,10 +72,10 @@ class FileLineEdit(QtWidgets.QWidget):
         layout.addWidget(button)
 
         button.clicked.connect(self.buttonClicked)
-        self.lineEdit.textEdited.connect(self.textEdited)
-        self.lineEdit.textChanged.connect(self.validate)
 
     def buttonClicked(self):
+        # the dialog may have created the file or folder, don't trust earlier checks
+        _cachedExists.cache_clear()
         if self.isDirectory:
             url = QtWidgets.QFileDialog.getExistingDirectoryUrl(self.window(), "Choose a Folder", self.filePath())
         else:
@@ -65,17 +99,31 @@ class FileLineEdit(QtWidgets.QWidget):
         return self.lineEdit.isReadOnly()
 
     def validate(self):
-        url = self.filePath()
-        textColor = self.validTextColor
-        if not url.isValid() or QFile.exists(url.toString(QUrl.UrlFormattingOption.PreferLocalFile)) is False:
-            textColor = self.errorTextColor
-        palette = self.lineEdit.palette()
-        palette.setColor(QtGui.QPalette.ColorRole.Text, textColor)
-        self.lineEdit.setPalette(palette)
+        # a direct call makes any pending deferred validation redundant
+        self._validateTimer.stop()
+        path = _localPath(self.lineEdit.text())
+        isValid = path is not None and _exists(path)
+        if isValid == self._isValid:
+            return
+        self._isValid = isValid
+        self._applyPalette()
+
+    def _updatePalettes(self):
+        """Rebuild the valid and error palettes from the line edit's base palette."""
+        self._okPalette = QtGui.QPalette(self._basePalette)
+        self._okPalette.setColor(QtGui.QPalette.ColorRole.Text, self.validTextColor)
+        self._errorPalette = QtGui.QPalette(self._basePalette)
+        self._errorPalette.setColor(QtGui.QPalette.ColorRole.Text, self.errorTextColor)
+        if self._isValid is not None:
+            self._applyPalette()
+
+    def _applyPalette(self):
+        self.lineEdit.setPalette(self._okPalette if self._isValid else self._errorPalette)
         self.lineEdit.update()
 
     def setErrorTextColor(self, color):
         self.errorTextColor = color
+        self._updatePalettes()
 
     def setFilter(self, filter):
         self.filter = filter
@@ -85,6 +133,7 @@ class FileLineEdit(QtWidgets.QWidget):
 
     def setOkTextColor(self, color):
         self.validTextColor = color
+        self._updatePalettes()
 
     def setText(self, text):
         self.lineEdit.setText(text)
@@ -10,6 +10,10 @@ class HorizontalDivider(QtWidgets.QWidget):
         self.__spacing = None
         self.__labelWidth = 0
         self.__labelHeight = 0
+        self.__textPen = None
+        self.__linePen = None
+        self.__textPos = None
+        self.__line = None
 
         self.palette = QtWidgets.QApplication.instance().palette()
         self.setSpacing(6)
@@ -37,22 +41,47 @@ class HorizontalDivider(QtWidgets.QWidget):
         self.__spacing = width
         self.update()
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() in (QtCore.QEvent.Type.PaletteChange, QtCore.QEvent.Type.StyleChange):
+            self.palette = QtWidgets.QApplication.instance().palette()
+            self.__textPen = self.__linePen = None
+        elif event.type() == QtCore.QEvent.Type.FontChange:
+            self.__calculateSize()
+        super(HorizontalDivider, self).changeEvent(event)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self.__textPos = None
+        super(HorizontalDivider, self).resizeEvent(event)
+
     def paintEvent(self, event) -> None:
         painter = QtGui.QPainter(self)
-        pen = QtGui.QPen(self.palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text), 1)
-        painter.setPen(pen)
+        # only axis-aligned rects and lines are drawn
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
 
-        cy = self.rect().center().y()
-        textPos = QtCore.QPointF(0, cy - int(self.__labelHeight) / 2)
-        painter.drawStaticText(textPos, self.__label)
+        if self.__textPen is None:
+            textColor = self.palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text)
+            self.__textPen = QtGui.QPen(textColor, 1)
+            self.__linePen = QtGui.QPen(self.palette.color(QtGui.QPalette.ColorRole.Mid), 1)
+        if self.__textPos is None:
+            self.__updatePositions()
 
-        pen = QtGui.QPen(self.palette.color(QtGui.QPalette.ColorRole.Mid), 1)
-        painter.setPen(pen)
-        painter.drawLine(self.__labelWidth, cy, self.width(), cy)
+        painter.setPen(self.__textPen)
+        painter.drawStaticText(self.__textPos, self.__label)
+
+        painter.setPen(self.__linePen)
+        painter.drawLine(self.__line)
+
+    def __updatePositions(self) -> None:
+        cy = self.rect().center().y()
+        self.__textPos = QtCore.QPointF(0, cy - int(self.__labelHeight) / 2)
+        self.__line = QtCore.QLine(self.__labelWidth, cy, self.width(), cy)
 
     def __calculateSize(self) -> None:
         fm = self.fontMetrics()
         self.__labelHeight = fm.height()
         self.__labelWidth = fm.horizontalAdvance(self.__name) + self.__spacing
         self.setFixedHeight(self.__labelHeight - 1)
+        self.__textPos = None
+        # lay out the glyphs now instead of on the first paint
+        self.__label.prepare(QtGui.QTransform(), self.font())
         self.update()
@@ -1,9 +1,13 @@
-from PyQt6 import QtCore, QtGui, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets, sip
 
 
 class SliderLabel(QtWidgets.QLabel):
     resetRequested = QtCore.pyqtSignal()
 
+    # only the hovered label can be waiting to show its reset text, so all labels share one timer.
+    _sharedTimer = None
+    _pending = None
+
     def __init__(self, parent=None):
         super(SliderLabel, self).__init__(parent)
         self._name = ""
@@ -14,14 +18,32 @@ class SliderLabel(QtWidgets.QLabel):
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Fixed)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignHCenter)
 
-        self.showResetTextTimer = QtCore.QTimer()
-        self.showResetTextTimer.timeout.connect(self.showResetText)
-        self.showResetTextTimer.setSingleShot(True)
-
         self.setToolTip("Click to reset to default value")
 
+    @classmethod
+    def _showResetTextTimer(cls) -> QtCore.QTimer:
+        if cls._sharedTimer is None:
+            cls._sharedTimer = QtCore.QTimer()
+            cls._sharedTimer.setSingleShot(True)
+            cls._sharedTimer.timeout.connect(cls._onShowResetTextTimeout)
+        return cls._sharedTimer
+
+    @classmethod
+    def _onShowResetTextTimeout(cls) -> None:
+        label = cls._pending
+        if label is None:
+            return
+        # the label can be destroyed while hovered without ever getting a leaveEvent (deleteLater,
+        # WA_DeleteOnClose window closed from the keyboard), so don't touch a dead wrapper.
+        if sip.isdeleted(label):
+            cls._pending = None
+            return
+        label.showResetText()
+
     def showResetText(self) -> None:
-        self.showResetTextTimer.stop()
+        if SliderLabel._pending is self:
+            SliderLabel._pending = None
+            self._showResetTextTimer().stop()
         if self._hovering:
             self.setText('reset?')
 
@@ -36,12 +58,15 @@ class SliderLabel(QtWidgets.QLabel):
     def enterEvent(self, event: QtCore.QEvent.Type.Enter) -> None:
         super(SliderLabel, self).enterEvent(event)
         self._hovering = True
-        self.showResetTextTimer.start(self._delay)
+        SliderLabel._pending = self
+        self._showResetTextTimer().start(self._delay)
         event.accept()
 
     def leaveEvent(self, event: QtCore.QEvent.Type.Leave) -> None:
         super(SliderLabel, self).leaveEvent(event)
         self._hovering = False
+        if SliderLabel._pending is self:
+            SliderLabel._pending = None
         self.switchText()
         event.accept()
 
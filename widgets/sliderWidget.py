@@ -1,12 +1,28 @@
+import contextlib
+from typing import TYPE_CHECKING, Optional
+
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import pyqtSlot
 
-from widgets.sliderLabel import SliderLabel
+if TYPE_CHECKING:
+    # imported on first use in _applyName(), nameless SliderWidgets never need it
+    from widgets.sliderLabel import SliderLabel
+
+# lay the children out by their widget rect instead of asking the style for layout item rects on every
+# pass (macOS style margins). set to False before creating SliderWidgets to keep the themed margins.
+LAYOUT_USES_WIDGET_RECT = True
 
 
 class SliderWidget(QtWidgets.QWidget):
+    # SliderWidget draws nothing itself, the layout margins show the parent through, so it can't be
+    # marked WA_OpaquePaintEvent. Applications embedding many of them can instead set
+    # QT_NO_SUBTRACTOPAQUESIBLINGS=1 in the environment before creating the QApplication to skip
+    # Qt's opaque-sibling clipping on repaint.
     valueChanged = QtCore.pyqtSignal(int)
 
+    # QFont.key() -> (QFontMetrics, width of the 'reset?' text), shared by every instance
+    _fontMetricsCache = {}
+
     def __init__(self, parent=None, value=0, minimum=0, maximum=100, name=''):
         super().__init__(parent)
         self._value = None
@@ -16,6 +32,12 @@ class SliderWidget(QtWidgets.QWidget):
         self._defaultValue = value
         self._name = name
 
+        # valueChanged throttling, off until setEmitInterval() is called with a positive interval
+        self._emitTimer = None
+        self._emitPending = False
+        # cleared by bulkUpdate() to hold valueChanged back while values are applied
+        self._externalEmitEnabled = True
+
         self._layout = QtWidgets.QHBoxLayout()
         self.setLayout(self._layout)
 
@@ -26,71 +48,200 @@ class SliderWidget(QtWidgets.QWidget):
         self._spinbox.setSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Fixed)
         self._spinbox.setMinimumWidth(60)
 
-        self.setValue(value)
-        self.setMinimum(minimum)
-        self.setMaximum(maximum)
+        if LAYOUT_USES_WIDGET_RECT:
+            for widget in (self, self._slider, self._spinbox):
+                widget.setAttribute(QtCore.Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
 
-        if name:
-            self._label = SliderLabel()
-            self._label.setText(name)
-            self.setName(name)
-            self._label.setBuddy(self._spinbox)
-            self._label.resetRequested.connect(self._reset)
+        self._applyRangeAndValue(minimum, maximum, value)
+
+        # the label is created and measured when the widget is polished, see event()
+        self._label = None
+        self._pendingName = name
 
-        self._spinbox.valueChanged.connect(self.setValue)
+        # keep the children in sync through native connections, only the slider reports back to Python.
+        # the loop ends by itself since QAbstractSlider/QSpinBox don't emit for an unchanged value.
+        self._spinbox.valueChanged.connect(self._slider.setValue)
+        self._slider.valueChanged.connect(self._spinbox.setValue)
         self._slider.valueChanged.connect(self.setValue)
+        self._slider.sliderReleased.connect(self._flushValueChanged)
 
         self._layout.addWidget(self._spinbox)
         self._layout.addWidget(self._slider)
 
+    @classmethod
+    def createMany(cls, configs, parent=None) -> list:
+        """Create one SliderWidget per dict of constructor arguments in configs.
+
+        This is a convenience loop. With a parent, the parent's updates are held off until every widget
+        is built and polished against the parent's font. Without one nothing is batched, each widget is
+        polished as usual once it is placed and shown."""
+        if parent is None:
+            return [cls(**config) for config in configs]
+
+        updatesEnabled = parent.updatesEnabled()
+        parent.setUpdatesEnabled(False)
+        try:
+            widgets = [cls(parent, **config) for config in configs]
+            for widget in widgets:
+                widget.ensurePolished()
+        finally:
+            parent.setUpdatesEnabled(updatesEnabled)
+        return widgets
+
+    @classmethod
+    @contextlib.contextmanager
+    def bulkUpdate(cls, widgets):
+        """Hold back valueChanged of the given SliderWidgets inside the with block, afterwards every
+        widget whose value changed emits once with its final value."""
+        widgets = list(widgets)
+        states = [(widget, widget._value, widget._externalEmitEnabled) for widget in widgets]
+        for widget in widgets:
+            widget._externalEmitEnabled = False
+        try:
+            yield
+        finally:
+            for widget, value, enabled in states:
+                widget._externalEmitEnabled = enabled
+                if enabled and (widget._value != value or widget._emitPending):
+                    # this emit supersedes a throttled one still waiting from before the block
+                    if widget._emitTimer is not None:
+                        widget._emitTimer.stop()
+                    widget._emitPending = False
+                    widget.valueChanged.emit(widget._value)
+
     @pyqtSlot()
     def _reset(self) -> None:
         self.setValue(self._defaultValue)
 
+    def event(self, event: QtCore.QEvent) -> bool:
+        result = super().event(event)
+        # polishing runs before the layout is first activated, so adding the label here
+        # doesn't cost a second relayout like it would in showEvent
+        if event.type() == QtCore.QEvent.Type.Polish and self._pendingName:
+            self._pendingName, name = None, self._pendingName
+            self._applyName(name)
+        return result
+
     def setName(self, name) -> None:
-        if name:
-            fm = QtGui.QFontMetrics(self._label.font())
-            w1 = fm.horizontalAdvance(name)
-            w2 = fm.horizontalAdvance('reset?')
-            self._label.setMinimumWidth(max(w1, w2))
-            self._layout.addWidget(self._label)
+        if self._label is None and not self.testAttribute(QtCore.Qt.WidgetAttribute.WA_WState_Polished):
+            # nothing to measure until the widget is polished
+            self._pendingName = name
+            return
+        self._pendingName = None
+        self._applyName(name)
+
+    def _applyName(self, name) -> None:
+        if not name:
+            return
+        if self._label is None:
+            from widgets.sliderLabel import SliderLabel
+            self._label = SliderLabel()
             self._label.setText(name)
+            self._label.setBuddy(self._spinbox)
+            self._label.resetRequested.connect(self._reset)
+            if LAYOUT_USES_WIDGET_RECT:
+                self._label.setAttribute(QtCore.Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
+            self._layout.insertWidget(0, self._label)
+        font = self._label.font()
+        key = font.key()
+        cached = self._fontMetricsCache.get(key)
+        if cached is None:
+            fm = QtGui.QFontMetrics(font)
+            cached = self._fontMetricsCache[key] = (fm, fm.horizontalAdvance('reset?'))
+        fm, w2 = cached
+        w1 = fm.horizontalAdvance(name)
+        self._label.setMinimumWidth(max(w1, w2))
+        self._label.setText(name)
 
     @pyqtSlot(int)
     def setValue(self, value) -> None:
+        # clamp up front so listeners never see a value the children would reject
+        value = max(self._minimum, min(value, self._maximum))
         if value == self._value:
-            if self._value is None:
-                self._defaultValue = value
             return
 
-        self._slider.blockSignals(True)
-        self._spinbox.blockSignals(True)
-
         self._value = value
-        self.valueChanged.emit(value)
+        self._emitValue(value)
 
-        self._slider.setValue(value)
-        self._spinbox.setValue(value)
+        # the spinbox follows the slider on its own, and the re-entrant call from the slider's
+        # valueChanged hits the equality check above and returns.
+        slider = self._slider
+        if slider.value() != value:
+            slider.setValue(value)
 
-        self._slider.blockSignals(False)
-        self._spinbox.blockSignals(False)
+    def _emitValue(self, value) -> None:
+        if not self._externalEmitEnabled:
+            return
+        emitTimer = self._emitTimer
+        if emitTimer is None:
+            self.valueChanged.emit(value)
+        elif emitTimer.isActive():
+            # inside the interval, the timeout sends whatever the value is by then
+            self._emitPending = True
+        else:
+            self.valueChanged.emit(value)
+            emitTimer.start()
 
-    def setMinimum(self, minimum) -> None:
-        self._slider.setMinimum(minimum)
-        self._spinbox.setMinimum(minimum)
+    def setEmitInterval(self, msec) -> None:
+        """Emit valueChanged at most once per msec milliseconds, 0 emits on every change. The first change
+        goes out right away, later ones within the interval are coalesced into one emit at its end."""
+        if msec > 0:
+            if self._emitTimer is None:
+                self._emitTimer = QtCore.QTimer(self)
+                self._emitTimer.setSingleShot(True)
+                self._emitTimer.timeout.connect(self._onEmitTimeout)
+            self._emitTimer.setInterval(msec)
+        elif self._emitTimer is not None:
+            self._flushValueChanged()
+            self._emitTimer.deleteLater()
+            self._emitTimer = None
 
-        if self._value < minimum:
-            self.setValue(minimum)
+    @pyqtSlot()
+    def _onEmitTimeout(self) -> None:
+        # while bulkUpdate() holds emits back the pending value is left for it to send
+        if self._emitPending and self._externalEmitEnabled:
+            self._emitPending = False
+            self.valueChanged.emit(self._value)
+            self._emitTimer.start()
 
-    def setMaximum(self, maximum) -> None:
-        self._slider.setMaximum(maximum)
-        self._spinbox.setMaximum(maximum)
+    @pyqtSlot()
+    def _flushValueChanged(self) -> None:
+        # emit a pending throttled value right away, e.g. when the user lets go of the slider
+        if self._emitPending:
+            self._emitTimer.stop()
+            self._emitPending = False
+            self.valueChanged.emit(self._value)
+
+    def _applyRangeAndValue(self, minimum, maximum, value) -> None:
+        # set range and value on both children in one go, without clamping against a stale range.
+        # the children stay silent, so valueChanged goes out at most once with the final value.
+        value = max(minimum, min(value, maximum))
+        self._minimum = minimum
+        self._maximum = maximum
+        with QtCore.QSignalBlocker(self._slider), QtCore.QSignalBlocker(self._spinbox):
+            self._slider.setRange(minimum, maximum)
+            self._spinbox.setRange(minimum, maximum)
+            self._slider.setValue(value)
+            self._spinbox.setValue(value)
 
-        if self._value > maximum:
-            self.setValue(maximum)
+        if value != self._value:
+            self._value = value
+            self._emitValue(value)
+
+    def setMinimum(self, minimum) -> None:
+        # like QAbstractSlider, a minimum above the maximum moves the maximum along
+        self._applyRangeAndValue(minimum, max(self._maximum, minimum), self._value)
+
+    def setMaximum(self, maximum) -> None:
+        # like QAbstractSlider, a maximum below the minimum moves the minimum along
+        self._applyRangeAndValue(min(self._minimum, maximum), maximum, self._value)
 
     @property
-    def label(self) -> SliderLabel:
+    def label(self) -> Optional['SliderLabel']:
+        if self._label is None and self._pendingName:
+            # build the label early for callers that need it before the first show
+            self._pendingName, name = None, self._pendingName
+            self._applyName(name)
         return self._label
 
     @property